@@ -2,6 +2,8 @@
 Example demonstrating pattern detection at multiple levels.
 """
 
+from itertools import islice
+
 from pardes import PatternDetector
 
 
@@ -29,8 +31,8 @@ def main():
     print("LITERAL PATTERN OCCURRENCES:")
     print("-" * 60)
     keywords = ["pattern", "structure", "analysis"]
-    for keyword in keywords:
-        matches = detector.find_literal_patterns(keyword, case_sensitive=False)
+    keyword_matches = detector.find_literal_patterns_batch(keywords, case_sensitive=False)
+    for keyword, matches in keyword_matches.items():
         print(f"  '{keyword}' appears {len(matches)} times")
     print()
     
@@ -54,8 +56,8 @@ def main():
     # Keyword contexts
     print("CONTEXTUAL ANALYSIS - 'pattern':")
     print("-" * 60)
-    contexts = detector.get_keyword_contexts("pattern", context_size=50)
-    for i, context in enumerate(contexts[:3], 1):
+    contexts = islice(detector.iter_keyword_contexts("pattern", context_size=50), 3)
+    for i, context in enumerate(contexts, 1):
         print(f"  Context {i}: ...{context.strip()}...")
     print()
     
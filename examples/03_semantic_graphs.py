@@ -27,7 +27,7 @@ def main():
     
     print("GRAPH STATISTICS:")
     print("-" * 60)
-    stats = graph.get_graph_statistics()
+    stats = graph.get_graph_statistics(heavy=True)
     for key, value in stats.items():
         if isinstance(value, float):
             print(f"  {key}: {value:.4f}")
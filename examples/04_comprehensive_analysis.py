@@ -43,8 +43,8 @@ def main():
     
     key_concepts = ["meaning", "layer", "pattern", "understanding"]
     print("Key concept frequencies:")
-    for concept in key_concepts:
-        matches = detector.find_literal_patterns(concept, case_sensitive=False)
+    concept_matches = detector.find_literal_patterns_batch(key_concepts, case_sensitive=False)
+    for concept, matches in concept_matches.items():
         if matches:
             print(f"  {concept}: {len(matches)} occurrences")
     
@@ -81,7 +81,7 @@ def main():
     graph = SemanticGraph()
     graph.build_cooccurrence_graph(text, window_size=5, min_frequency=2)
     
-    graph_stats = graph.get_graph_statistics()
+    graph_stats = graph.get_graph_statistics(heavy=True)
     print(f"Network nodes: {graph_stats['nodes']}")
     print(f"Network edges: {graph_stats['edges']}")
     print(f"Network density: {graph_stats['density']:.4f}")
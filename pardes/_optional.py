@@ -0,0 +1,45 @@
+"""
+Optional Dependencies
+
+Helpers for importing the optional accelerator packages (numba, scipy,
+igraph, hyperscan) on first use, so that importing pardes stays fast and
+works without them.
+"""
+
+import importlib
+from functools import lru_cache
+from typing import Callable, Optional
+
+
+@lru_cache(maxsize=None)
+def import_optional(name: str):
+    """
+    Import an optional dependency the first time it is needed.
+    
+    Args:
+        name: Fully qualified module name, e.g. "scipy.sparse"
+    
+    Returns:
+        The imported module, or None if it is not installed
+    """
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def jit(func: Callable) -> Optional[Callable]:
+    """
+    Compile a numeric kernel with numba the first time it is needed.
+    
+    Args:
+        func: Function written in the numba-compatible subset of Python
+    
+    Returns:
+        The compiled function, or None if numba is not installed
+    """
+    numba = import_optional("numba")
+    if numba is None:
+        return None
+    return numba.njit(cache=True)(func)
@@ -7,9 +7,163 @@ and relational/contextual analysis.
 """
 
 import re
-from typing import List, Dict, Set, Tuple, Optional, Callable
-from collections import defaultdict
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from typing import Iterator, List, Dict, Set, Tuple, Optional, Callable
+from collections import defaultdict, deque
+import numpy as np
 from pardes.text_parser import TextParser
+from pardes._optional import import_optional
+
+
+@lru_cache(maxsize=256)
+def _compile(pattern: str, flags: int = 0) -> "re.Pattern":
+    """
+    Compile a regular expression, memoizing the result.
+    
+    Args:
+        pattern: The regular expression source
+        flags: Regular expression flags
+        
+    Returns:
+        The compiled pattern
+    """
+    return re.compile(pattern, flags)
+
+
+def _tokenize(text: str) -> Tuple[str, ...]:
+    """
+    Tokenize a fragment of text into lowercase words.
+    
+    Uses a throwaway TextParser so the detector's own parser state is untouched.
+    
+    Args:
+        text: The text fragment to tokenize
+        
+    Returns:
+        Tuple of lowercase word tokens
+    """
+    return tuple(TextParser(text).iter_words(lowercase=True))
+
+
+def _word_bits(words: List[str], vocab: Dict[str, int]) -> int:
+    """
+    Encode a set of words as an integer bitmask over a shared vocabulary.
+    
+    Words not yet in the vocabulary are assigned the next free bit.
+    
+    Args:
+        words: The words to encode
+        vocab: Mapping from word to bit index, extended in place
+        
+    Returns:
+        Bitmask with one bit set per distinct word
+    """
+    bits = 0
+    for word in words:
+        index = vocab.get(word)
+        if index is None:
+            index = vocab[word] = len(vocab)
+        bits |= 1 << index
+    return bits
+
+
+if hasattr(int, 'bit_count'):
+    _popcount = int.bit_count
+else:  # pragma: no cover - Python < 3.10
+    def _popcount(bits: int) -> int:
+        return bin(bits).count('1')
+
+
+def _cached_per_text(method: Callable) -> Callable:
+    """
+    Memoize a deterministic PatternDetector method until the next load_text.
+    
+    Results are stored per argument tuple in the instance's result cache.
+    Each call returns fresh copies of the result records and of any lists
+    inside them, so callers cannot alter the cached copy.
+    
+    Args:
+        method: The method to memoize
+        
+    Returns:
+        The wrapped method
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        results = self._result_cache.get(key)
+        if results is None:
+            results = self._result_cache[key] = method(self, *args, **kwargs)
+        return [{k: list(v) if isinstance(v, list) else v for k, v in record.items()}
+                for record in results]
+    return wrapper
+
+
+@lru_cache(maxsize=1024)
+def _word_pattern(word: str, ignore_case: bool = False) -> "re.Pattern":
+    """
+    Compile a whole-word pattern for a literal word, memoizing the result.
+    
+    Args:
+        word: The word to match
+        ignore_case: Whether matching is case-insensitive
+        
+    Returns:
+        The compiled pattern
+    """
+    return re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE if ignore_case else 0)
+
+
+_NON_SPACE = re.compile(r'\S')
+_WORD = re.compile(r'\w+')
+_NO_POSITIONS = np.empty(0, dtype=np.int64)
+_REGEX_METACHARACTERS = frozenset('.^$*+?{}[]\\|()')
+
+
+def _is_ascii_literal(pattern: str) -> bool:
+    """
+    Check whether a pattern is a non-empty ASCII string without regex syntax.
+    
+    NUL characters are rejected because hyperscan reads each expression as
+    a NUL-terminated string.
+    
+    Args:
+        pattern: The pattern to check
+        
+    Returns:
+        True if the pattern matches only itself
+    """
+    return (bool(pattern) and pattern.isascii() and '\x00' not in pattern
+            and _REGEX_METACHARACTERS.isdisjoint(pattern))
+
+
+@lru_cache(maxsize=32)
+def _hyperscan_database(literals: Tuple[str, ...], case_sensitive: bool):
+    """
+    Compile a hyperscan database matching any of the given literals.
+    
+    Args:
+        literals: ASCII literal patterns; each is reported under its index
+        case_sensitive: Whether matching is case-sensitive
+        
+    Returns:
+        The compiled hyperscan database
+    """
+    hyperscan = import_optional("hyperscan")
+    flags = hyperscan.HS_FLAG_SOM_LEFTMOST
+    if not case_sensitive:
+        flags |= hyperscan.HS_FLAG_CASELESS
+    
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[literal.encode('ascii') for literal in literals],
+        ids=list(range(len(literals))),
+        elements=len(literals),
+        flags=[flags] * len(literals),
+    )
+    return database
 
 
 class PatternDetector:
@@ -31,6 +185,9 @@ class PatternDetector:
         """
         self.text = text
         self.parser = TextParser(text)
+        self._sentence_tokens = None
+        self._result_cache = {}
+        self._positions = {}
     
     def load_text(self, text: str) -> None:
         """
@@ -41,6 +198,22 @@ class PatternDetector:
         """
         self.text = text
         self.parser.load_text(text)
+        self._sentence_tokens = None
+        self._result_cache = {}
+        self._positions = {}
+    
+    def _ensure_sentence_tokens(self) -> List[Tuple[str, ...]]:
+        """
+        Get the lowercase word tokens of each sentence, tokenizing once per load.
+        
+        Returns:
+            List of token tuples, aligned with parser.segment_sentences()
+        """
+        if self._sentence_tokens is None:
+            self._sentence_tokens = [
+                _tokenize(sent) for sent in self.parser.segment_sentences()
+            ]
+        return self._sentence_tokens
     
     def find_literal_patterns(self, pattern: str, case_sensitive: bool = True) -> List[Dict]:
         """
@@ -53,24 +226,103 @@ class PatternDetector:
         Returns:
             List of matches with position and context information
         """
+        return list(self.iter_literal_patterns(pattern, case_sensitive))
+    
+    def iter_literal_patterns(self, pattern: str, case_sensitive: bool = True) -> Iterator[Dict]:
+        """
+        Lazily yield occurrences of a literal pattern in the text.
+        
+        Args:
+            pattern: The pattern to search for (can be regex)
+            case_sensitive: Whether the search is case-sensitive
+            
+        Returns:
+            Iterator over matches with position and context information
+        """
         flags = 0 if case_sensitive else re.IGNORECASE
-        matches = []
+        for match in _compile(pattern, flags).finditer(self.text):
+            yield self._literal_match(match.start(), match.end())
+    
+    def find_literal_patterns_batch(self, patterns: List[str],
+                                    case_sensitive: bool = True,
+                                    max_workers: Optional[int] = None) -> Dict[str, List[Dict]]:
+        """
+        Find all occurrences of several patterns in the text.
+        
+        Plain ASCII literals are matched together in a single scan when the
+        optional hyperscan package is installed; regular expressions and
+        non-ASCII input fall back to find_literal_patterns. With max_workers
+        set, those fallback scans run on a thread pool, which only overlaps
+        work on interpreters built without the GIL.
         
-        for match in re.finditer(pattern, self.text, flags=flags):
-            # Get context around the match
-            start = max(0, match.start() - 50)
-            end = min(len(self.text), match.end() + 50)
-            context = self.text[start:end]
+        Args:
+            patterns: The patterns to search for (can be regex)
+            case_sensitive: Whether the search is case-sensitive
+            max_workers: Number of threads for fallback scans (default: sequential)
             
-            matches.append({
-                'match': match.group(),
-                'start': match.start(),
-                'end': match.end(),
-                'context': context
-            })
-        
-        return matches
+        Returns:
+            Dictionary mapping each pattern to its list of matches
+        """
+        results = {p: None for p in patterns}
+        
+        if self.text.isascii() and import_optional("hyperscan") is not None:
+            literals = tuple(p for p in results if _is_ascii_literal(p))
+            if literals:
+                spans = defaultdict(list)
+                
+                def on_match(pattern_id, start, end, flags, context):
+                    spans[pattern_id].append((start, end))
+                
+                database = _hyperscan_database(literals, case_sensitive)
+                # The cached database is shared between threads, so each scan
+                # needs its own scratch space
+                hyperscan = import_optional("hyperscan")
+                database.scan(self.text.encode('ascii'), match_event_handler=on_match,
+                              scratch=hyperscan.Scratch(database))
+                
+                for pattern_id, pattern in enumerate(literals):
+                    # Hyperscan reports overlapping hits; keep the leftmost
+                    # non-overlapping ones, as re.finditer would
+                    matches = []
+                    last_end = 0
+                    for start, end in spans[pattern_id]:
+                        if start >= last_end:
+                            matches.append(self._literal_match(start, end))
+                            last_end = end
+                    results[pattern] = matches
+        
+        remaining = [p for p, matches in results.items() if matches is None]
+        if max_workers is not None and max_workers > 1 and len(remaining) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(remaining))) as executor:
+                futures = {p: executor.submit(self.find_literal_patterns, p, case_sensitive)
+                           for p in remaining}
+                for pattern, future in futures.items():
+                    results[pattern] = future.result()
+        else:
+            for pattern in remaining:
+                results[pattern] = self.find_literal_patterns(pattern, case_sensitive)
+        
+        return results
     
+    def _literal_match(self, start: int, end: int) -> Dict:
+        """
+        Build the match record for a literal pattern hit.
+        
+        Args:
+            start: Start offset of the match
+            end: End offset of the match
+            
+        Returns:
+            Dictionary with the match, its position and surrounding context
+        """
+        return {
+            'match': self.text[start:end],
+            'start': start,
+            'end': end,
+            'context': self.text[max(0, start - 50):min(len(self.text), end + 50)]
+        }
+    
+    @_cached_per_text
     def find_repeated_structures(self, min_length: int = 3, 
                                  min_occurrences: int = 2) -> List[Dict]:
         """
@@ -101,6 +353,7 @@ class PatternDetector:
         
         return results
     
+    @_cached_per_text
     def find_parallel_structures(self, separator: Optional[str] = None) -> List[Dict]:
         """
         Find parallel grammatical structures (sentences/clauses with similar patterns).
@@ -114,33 +367,50 @@ class PatternDetector:
         # Split into segments (sentences by default)
         if separator:
             segments = self.text.split(separator)
+            segment_tokens = [_tokenize(seg) for seg in segments]
         else:
             segments = self.parser.segment_sentences()
+            segment_tokens = self._ensure_sentence_tokens()
+        
+        # Encode each segment once as a vocabulary bitmask
+        vocab = {}
+        tokens = []
+        for seg, words in zip(segments, segment_tokens):
+            bits = _word_bits(words, vocab)
+            tokens.append((seg, bits, _popcount(bits), len(words)))
+        
+        # Structural similarity requires word counts within 2 of each other,
+        # so only segments in neighbouring length buckets are candidates
+        by_length = defaultdict(list)
+        for index, entry in enumerate(tokens):
+            by_length[entry[3]].append(index)
         
         # Simple parallel structure detection: similar word patterns
         parallels = []
         
-        for i, seg1 in enumerate(segments):
-            self.parser.load_text(seg1)
-            words1 = self.parser.tokenize_words(lowercase=True)
+        for i, (seg1, bits1, size1, len1) in enumerate(tokens):
+            candidates = []
+            for length in range(len1 - 2, len1 + 3):
+                bucket = by_length.get(length)
+                if bucket:
+                    candidates.extend(bucket[bisect_right(bucket, i):])
+            candidates.sort()
             
-            for j, seg2 in enumerate(segments[i+1:], start=i+1):
-                self.parser.load_text(seg2)
-                words2 = self.parser.tokenize_words(lowercase=True)
-                
-                # Check for structural similarity (same length, similar word types)
-                if abs(len(words1) - len(words2)) <= 2:
-                    common_words = set(words1) & set(words2)
-                    if len(common_words) >= min(len(words1), len(words2)) * 0.3:
-                        parallels.append({
-                            'segment1': seg1.strip(),
-                            'segment2': seg2.strip(),
-                            'similarity': len(common_words) / max(len(words1), len(words2)),
-                            'type': 'parallel_structure'
-                        })
-        
-        # Restore original text
-        self.parser.load_text(self.text)
+            for j in candidates:
+                seg2, bits2, size2, len2 = tokens[j]
+                threshold = min(len1, len2) * 0.3
+                # The overlap can never exceed the smaller word set
+                if min(size1, size2) < threshold:
+                    continue
+                common = _popcount(bits1 & bits2)
+                if common >= threshold:
+                    parallels.append({
+                        'segment1': seg1.strip(),
+                        'segment2': seg2.strip(),
+                        'similarity': common / max(len1, len2),
+                        'type': 'parallel_structure'
+                    })
+        
         return parallels
     
     def find_co_occurrences(self, word1: str, word2: str, 
@@ -158,32 +428,64 @@ class PatternDetector:
         Returns:
             List of co-occurrence instances with context
         """
-        text = self.text if case_sensitive else self.text.lower()
-        w1 = word1 if case_sensitive else word1.lower()
-        w2 = word2 if case_sensitive else word2.lower()
-        
-        co_occurrences = []
-        
-        # Find all positions of word1
-        pattern1 = r'\b' + re.escape(w1) + r'\b'
-        for match1 in re.finditer(pattern1, text):
-            # Look for word2 in the window
-            window_start = max(0, match1.start() - window_size)
-            window_end = min(len(text), match1.end() + window_size)
-            window_text = text[window_start:window_end]
+        starts1 = self._word_positions(word1, case_sensitive)
+        if not len(starts1):
+            return []
+        positions2 = self._word_positions(word2, case_sensitive)
+        
+        # A window contains word2 if some occurrence starts at or after the window
+        # start and ends at or before the window end
+        window_starts = np.maximum(starts1 - window_size, 0)
+        window_ends = np.minimum(starts1 + len(word1) + window_size, len(self.text))
+        lo = np.searchsorted(positions2, window_starts, side='left')
+        hi = np.searchsorted(positions2, window_ends - len(word2), side='right')
+        
+        return [
+            {
+                'word1': word1,
+                'word2': word2,
+                'position1': start,
+                'context': self.text[window_start:window_end],
+                'type': 'co_occurrence'
+            }
+            for start, window_start, window_end, found in zip(
+                starts1.tolist(), window_starts.tolist(), window_ends.tolist(), (hi > lo).tolist()
+            )
+            if found
+        ]
+    
+    def _word_positions(self, word: str, case_sensitive: bool) -> np.ndarray:
+        """
+        Get the sorted start offsets of a whole word in the text.
+        
+        Single-token words are looked up in a word -> positions index built
+        with one pass over the text; other strings are scanned for directly.
+        
+        Args:
+            word: The word to locate
+            case_sensitive: Whether search is case-sensitive
             
-            pattern2 = r'\b' + re.escape(w2) + r'\b'
-            if re.search(pattern2, window_text):
-                co_occurrences.append({
-                    'word1': word1,
-                    'word2': word2,
-                    'position1': match1.start(),
-                    'context': self.text[window_start:window_end],
-                    'type': 'co_occurrence'
-                })
+        Returns:
+            Array of start offsets
+        """
+        key = word if case_sensitive else word.lower()
+        
+        if _WORD.fullmatch(key):
+            index = self._positions.get(case_sensitive)
+            if index is None:
+                offsets = defaultdict(list)
+                for match in _WORD.finditer(self.text):
+                    token = match.group()
+                    offsets[token if case_sensitive else token.lower()].append(match.start())
+                index = self._positions[case_sensitive] = {
+                    w: np.array(starts, dtype=np.int64) for w, starts in offsets.items()
+                }
+            return index.get(key, _NO_POSITIONS)
         
-        return co_occurrences
+        pattern = _word_pattern(word, not case_sensitive)
+        return np.fromiter((m.start() for m in pattern.finditer(self.text)), dtype=np.int64)
     
+    @_cached_per_text
     def find_chiastic_patterns(self) -> List[Dict]:
         """
         Find chiastic patterns (ABBA structures) in text.
@@ -193,41 +495,41 @@ class PatternDetector:
         Returns:
             List of potential chiastic structures
         """
-        sentences = self.parser.segment_sentences()
         chiasms = []
+        vocab = {}
+        # Sliding window over the last four (sentence, word bitmask, size) entries
+        window = deque(maxlen=4)
         
         # Look for ABBA patterns in sequences of sentences
-        for i in range(len(sentences) - 3):
-            seq = sentences[i:i+4]
-            
-            # Extract key words from each sentence
-            self.parser.load_text(seq[0])
-            words_a = set(self.parser.tokenize_words(lowercase=True))
-            
-            self.parser.load_text(seq[1])
-            words_b = set(self.parser.tokenize_words(lowercase=True))
-            
-            self.parser.load_text(seq[2])
-            words_b2 = set(self.parser.tokenize_words(lowercase=True))
+        sentences = self.parser.segment_sentences()
+        for sentence, words in zip(sentences, self._ensure_sentence_tokens()):
+            bits = _word_bits(words, vocab)
+            window.append((sentence, bits, _popcount(bits)))
+            if len(window) < 4:
+                continue
+            (_, bits_a, size_a), (_, bits_b, size_b), (_, bits_b2, size_b2), (_, bits_a2, size_a2) = window
             
-            self.parser.load_text(seq[3])
-            words_a2 = set(self.parser.tokenize_words(lowercase=True))
+            # The overlap can never exceed the smaller set, so skip windows
+            # whose size ratio alone rules out a match
+            if (min(size_a, size_a2) / max(size_a, size_a2, 1) <= 0.3
+                    or min(size_b, size_b2) / max(size_b, size_b2, 1) <= 0.3):
+                continue
             
             # Check if first and last are similar, and middle two are similar
-            ab_similarity = len(words_a & words_a2) / max(len(words_a), len(words_a2), 1)
-            ba_similarity = len(words_b & words_b2) / max(len(words_b), len(words_b2), 1)
+            ab_similarity = _popcount(bits_a & bits_a2) / max(size_a, size_a2, 1)
+            if ab_similarity <= 0.3:
+                continue
+            ba_similarity = _popcount(bits_b & bits_b2) / max(size_b, size_b2, 1)
             
-            if ab_similarity > 0.3 and ba_similarity > 0.3:
+            if ba_similarity > 0.3:
                 chiasms.append({
                     'pattern': 'ABBA',
-                    'segments': seq,
+                    'segments': [entry[0] for entry in window],
                     'ab_similarity': ab_similarity,
                     'ba_similarity': ba_similarity,
                     'type': 'chiastic_structure'
                 })
         
-        # Restore original text
-        self.parser.load_text(self.text)
         return chiasms
     
     def get_keyword_contexts(self, keyword: str, context_size: int = 100,
@@ -243,18 +545,28 @@ class PatternDetector:
         Returns:
             List of context strings containing the keyword
         """
-        pattern = keyword if case_sensitive else keyword.lower()
-        text = self.text if case_sensitive else self.text.lower()
-        
-        contexts = []
-        regex = r'\b' + re.escape(pattern) + r'\b'
+        return list(self.iter_keyword_contexts(keyword, context_size, case_sensitive))
+    
+    def iter_keyword_contexts(self, keyword: str, context_size: int = 100,
+                              case_sensitive: bool = False) -> Iterator[str]:
+        """
+        Lazily yield the contexts where a keyword appears.
         
-        for match in re.finditer(regex, text):
-            start = max(0, match.start() - context_size)
-            end = min(len(text), match.end() + context_size)
-            contexts.append(self.text[start:end])
+        Args:
+            keyword: The keyword to search for
+            context_size: Number of characters to include on each side
+            case_sensitive: Whether search is case-sensitive
+            
+        Returns:
+            Iterator over context strings containing the keyword
+        """
+        regex = _word_pattern(keyword, not case_sensitive)
         
-        return contexts
+        text = self.text
+        n = len(text)
+        c = context_size
+        for match in regex.finditer(text):
+            yield text[max(0, match.start() - c):min(n, match.end() + c)]
     
     def analyze_pattern_density(self, pattern: str, segment_size: int = 500) -> List[Dict]:
         """
@@ -267,19 +579,32 @@ class PatternDetector:
         Returns:
             List of segments with their pattern density
         """
-        results = []
+        if segment_size <= 0:
+            raise ValueError(f"segment_size must be positive, got {segment_size}")
         
-        for i in range(0, len(self.text), segment_size):
-            segment = self.text[i:i+segment_size]
-            matches = len(re.findall(pattern, segment, re.IGNORECASE))
-            
-            if segment.strip():
-                results.append({
-                    'start': i,
-                    'end': min(i + segment_size, len(self.text)),
-                    'pattern': pattern,
-                    'matches': matches,
-                    'density': matches / len(segment) if segment else 0
-                })
+        text = self.text
+        n = len(text)
+        compiled = _compile(pattern, re.IGNORECASE)
+        
+        # Scan the whole text once and bucket each match by the segment it starts in
+        counts = [0] * ((n + segment_size - 1) // segment_size)
+        for match in compiled.finditer(text):
+            # Empty matches can land on len(text), past the last segment
+            if match.start() < n:
+                counts[match.start() // segment_size] += 1
+        
+        bounds = [(i * segment_size, min((i + 1) * segment_size, n)) for i in range(len(counts))]
+        results = [
+            {
+                'start': start,
+                'end': end,
+                'pattern': pattern,
+                'matches': counts[i],
+                'density': counts[i] / (end - start)
+            }
+            for i, (start, end) in enumerate(bounds)
+            # Skip whitespace-only segments
+            if _NON_SPACE.search(text, start, end)
+        ]
         
         return results
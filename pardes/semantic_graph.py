@@ -6,10 +6,199 @@ This represents the "S" (Sod) level - integrated semantic network analysis
 showing relationships and connections between concepts.
 """
 
+import heapq
 import networkx as nx
+import numpy as np
 from typing import List, Dict, Set, Tuple, Optional
-from collections import defaultdict
+from bisect import bisect_right
 from pardes.text_parser import TextParser
+from pardes._optional import import_optional, jit
+
+# Graphs at least this large use igraph's C implementations when available
+_IGRAPH_MIN_NODES = 500
+
+# Texts with at least this many words count co-occurrences with the numba
+# kernel when available; below it, loading numba costs more than it saves
+_NUMBA_MIN_WORDS = 500_000
+
+# Sentences per block of the sparse product in _shared_word_counts
+_SENTENCE_BLOCK_ROWS = 256
+
+# Number of BFS sources used to estimate path statistics on large graphs
+_STATS_SAMPLE_SIZE = 100
+
+
+def _count_cooccurrences(ids: np.ndarray, window_size: int,
+                         table_size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Count word-id pairs that share a sliding window, window by window.
+    
+    Walks the windows in text order and aggregates pairs in an open-addressing
+    table, recording each pair's slot the first time it is seen. Meant to be
+    compiled with numba; see _count_cooccurrences_vectorized otherwise.
+    
+    Args:
+        ids: Array of integer word ids, in text order
+        window_size: Size of the sliding window (in words)
+        table_size: Number of hash table slots, a power of two larger than
+            the number of distinct pairs
+        
+    Returns:
+        Tuple of (smaller id, larger id, count) arrays, one entry per distinct
+        pair, ordered by where the pair is first seen when scanning windows
+    """
+    n = len(ids)
+    vocab_size = ids.max() + 1
+    mask = table_size - 1
+    slot_key = np.full(table_size, -1, dtype=np.int64)
+    slot_count = np.zeros(table_size, dtype=np.int64)
+    first_seen = np.empty(table_size, dtype=np.int64)
+    num_pairs = 0
+    
+    for i in range(n):
+        end = min(i + window_size, n)
+        for j in range(i, end):
+            for k in range(j + 1, end):
+                a, b = ids[j], ids[k]
+                if b < a:
+                    a, b = b, a
+                key = a * vocab_size + b
+                h = ((key ^ (key >> 17)) * 0x7FEB352D) & mask
+                while slot_key[h] != -1 and slot_key[h] != key:
+                    h = (h + 1) & mask
+                if slot_key[h] == -1:
+                    slot_key[h] = key
+                    first_seen[num_pairs] = h
+                    num_pairs += 1
+                slot_count[h] += 1
+    
+    slots = first_seen[:num_pairs]
+    keys = slot_key[slots]
+    return keys // vocab_size, keys % vocab_size, slot_count[slots]
+
+
+def _count_cooccurrences_vectorized(ids: np.ndarray,
+                                    window_size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Count word-id pairs that share a sliding window using numpy only.
+    
+    Every window of window_size consecutive words contributes one count for
+    each pair of positions inside it. A pair of positions (p, p + d) is
+    therefore counted once per window containing both, i.e.
+    min(window_size - d, p + 1) times, which lets each offset d be handled
+    as one vectorized slice instead of a loop over windows.
+    
+    Args:
+        ids: Array of integer word ids, in text order
+        window_size: Size of the sliding window (in words)
+        
+    Returns:
+        Tuple of (smaller id, larger id, count) arrays, one entry per distinct
+        pair, ordered by where the pair is first seen when scanning windows
+    """
+    n = len(ids)
+    rows, cols, weights, ranks = [], [], [], []
+    
+    for d in range(1, min(window_size, n)):
+        p = np.arange(n - d)
+        first, second = ids[:n - d], ids[d:]
+        rows.append(np.minimum(first, second))
+        cols.append(np.maximum(first, second))
+        weights.append(np.minimum(window_size - d, p + 1))
+        # Position of the pair in the first window that contains it
+        start = np.maximum(p + d - window_size + 1, 0)
+        ranks.append((start * window_size + (p - start)) * window_size + (p + d - start))
+    
+    if not rows:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, empty
+    
+    vocab_size = int(ids.max()) + 1
+    order = np.argsort(np.concatenate(ranks), kind='stable')
+    keys = (np.concatenate(rows) * vocab_size + np.concatenate(cols))[order]
+    weights = np.concatenate(weights)[order]
+    
+    unique_keys, first_seen, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    counts = np.bincount(inverse.ravel(), weights=weights, minlength=len(unique_keys))
+    
+    seen_order = np.argsort(first_seen)
+    unique_keys = unique_keys[seen_order]
+    return (unique_keys // vocab_size, unique_keys % vocab_size,
+            counts[seen_order].astype(np.int64))
+
+
+def _shared_word_counts(word_sets: List[Set[str]],
+                        min_common_words: int) -> List[Tuple[int, int, int]]:
+    """
+    Count the words shared by every pair of sentences with a sparse product.
+    
+    Builds the binary sentence-by-word incidence matrix M, so that entry
+    (i, j) of M @ M.T is the number of words sentences i and j have in common.
+    The product is formed _SENTENCE_BLOCK_ROWS rows at a time and filtered
+    before the next block, so pairs that share only a few words (stopwords,
+    typically) never accumulate.
+    
+    Args:
+        word_sets: Set of words for each sentence
+        min_common_words: Minimum number of common words to report (> 0)
+        
+    Returns:
+        List of (i, j, common) tuples with i < j, ordered by i then j
+    """
+    sp = import_optional("scipy.sparse")
+    vocab = {}
+    indices = [vocab.setdefault(w, len(vocab)) for words in word_sets for w in words]
+    indptr = np.cumsum([0] + [len(words) for words in word_sets])
+    incidence = sp.csr_matrix(
+        (np.ones(len(indices), dtype=np.int32), indices, indptr),
+        shape=(len(word_sets), len(vocab)),
+    )
+    
+    pairs = []
+    for start in range(0, len(word_sets), _SENTENCE_BLOCK_ROWS):
+        stop = start + _SENTENCE_BLOCK_ROWS
+        # Only sentences from start onwards can be the larger index of a pair
+        block = (incidence[start:stop] @ incidence[start:].T).tocoo()
+        rows, cols = block.row + start, block.col + start
+        keep = (cols > rows) & (block.data >= min_common_words)
+        rows, cols, common = rows[keep], cols[keep], block.data[keep]
+        order = np.lexsort((cols, rows))
+        pairs.extend(zip(rows[order].tolist(), cols[order].tolist(), common[order].tolist()))
+    return pairs
+
+
+def _bfs_distances(indptr: np.ndarray, indices: np.ndarray, source: int,
+                   radius: Optional[int] = None) -> np.ndarray:
+    """
+    Compute hop distances from a node with a level-synchronous BFS.
+    
+    Args:
+        indptr: CSR row pointers
+        indices: CSR column indices
+        source: Index of the starting node
+        radius: Maximum number of hops to expand, or None for no limit
+        
+    Returns:
+        Array of distances indexed like the CSR rows, -1 where unreached
+    """
+    distances = np.full(len(indptr) - 1, -1, dtype=np.int64)
+    frontier = np.array([source], dtype=np.int64)
+    distances[frontier] = 0
+    
+    level = 0
+    while radius is None or level < radius:
+        # Gather the adjacency slices of the whole frontier at once
+        starts = indptr[frontier]
+        lengths = indptr[frontier + 1] - starts
+        offsets = np.arange(lengths.sum()) + np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        neighbors = indices[offsets]
+        frontier = np.unique(neighbors[distances[neighbors] < 0])
+        if not len(frontier):
+            break
+        level += 1
+        distances[frontier] = level
+    
+    return distances
 
 
 class SemanticGraph:
@@ -21,12 +210,80 @@ class SemanticGraph:
     - Concept relationship graphs
     - Semantic clustering
     - Centrality and importance measures
+    
+    Derived results such as centrality scores are cached until the graph
+    changes. Code that edits self.graph directly must call invalidate()
+    afterwards.
     """
     
     def __init__(self):
         """Initialize an empty semantic graph."""
         self.graph = nx.Graph()
         self._parser = TextParser()
+        self._version = 0
+        self._centrality_cache = {}
+        self._csr = None
+        self._csr_key = None
+    
+    def invalidate(self) -> None:
+        """
+        Mark the graph as modified, dropping results derived from it.
+        
+        Call this after editing self.graph directly; the builder and
+        add_* methods already do.
+        """
+        self._version += 1
+        self._centrality_cache.clear()
+    
+    def _cache_key(self, *args) -> Tuple:
+        """
+        Build a cache key tied to the current version of the graph.
+        
+        Args:
+            *args: Parameters of the cached computation
+            
+        Returns:
+            Hashable cache key
+        """
+        return (self._version,) + args
+    
+    def _ensure_csr(self) -> Tuple[List, Dict, np.ndarray, np.ndarray]:
+        """
+        Get a compressed sparse row view of the adjacency, rebuilt when stale.
+        
+        Returns:
+            Tuple of (nodes, node -> index mapping, indptr, indices), where the
+            neighbours of nodes[i] are indices[indptr[i]:indptr[i+1]]
+        """
+        key = self._cache_key()
+        if self._csr_key != key:
+            nodes = list(self.graph)
+            index = {node: i for i, node in enumerate(nodes)}
+            adj = self.graph.adj
+            indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+            np.cumsum([len(adj[node]) for node in nodes], out=indptr[1:])
+            indices = np.fromiter((index[v] for node in nodes for v in adj[node]),
+                                  dtype=np.int64, count=int(indptr[-1]))
+            self._csr = (nodes, index, indptr, indices)
+            self._csr_key = key
+        return self._csr
+    
+    def _to_igraph(self) -> Tuple["igraph.Graph", List]:
+        """
+        Convert the graph to an unweighted igraph graph.
+        
+        Returns:
+            Tuple of (igraph graph, node list) where vertex i is nodes[i]
+        """
+        nodes, _, indptr, indices = self._ensure_csr()
+        # Keep each undirected edge once: the CSR lists it under both endpoints,
+        # except for self-loops, which appear once
+        rows = np.repeat(np.arange(len(nodes)), np.diff(indptr))
+        upper = rows <= indices
+        igraph = import_optional("igraph")
+        ig = igraph.Graph(n=len(nodes),
+                          edges=list(zip(rows[upper].tolist(), indices[upper].tolist())))
+        return ig, nodes
     
     def build_cooccurrence_graph(self, text: str, window_size: int = 5,
                                  min_frequency: int = 2,
@@ -41,27 +298,37 @@ class SemanticGraph:
             lowercase: Whether to normalize words to lowercase
         """
         self._parser.load_text(text)
-        words = self._parser.tokenize_words(lowercase=lowercase)
+        # Stream the tokens so the parser does not keep cached word lists
+        words = list(self._parser.iter_words(lowercase=lowercase))
         
-        # Count co-occurrences
-        co_occurrence = defaultdict(int)
-        
-        for i in range(len(words)):
-            window = words[i:i+window_size]
-            # Add edges for all pairs in the window
-            for j in range(len(window)):
-                for k in range(j+1, len(window)):
-                    pair = tuple(sorted([window[j], window[k]]))
-                    co_occurrence[pair] += 1
+        # Intern words as ids in order of first appearance, then renumber them
+        # by rank in the sorted vocabulary so id order matches string order
+        index = {}
+        first_ids = np.fromiter((index.setdefault(w, len(index)) for w in words),
+                                dtype=np.int64, count=len(words))
+        vocab = sorted(index)
+        rank = np.empty(len(vocab), dtype=np.int64)
+        rank[[index[w] for w in vocab]] = np.arange(len(vocab))
+        ids = rank[first_ids]
+        count_cooccurrences = None
+        if window_size > 1 and len(ids) > 1 and len(ids) >= _NUMBA_MIN_WORDS:
+            count_cooccurrences = jit(_count_cooccurrences)
+        if count_cooccurrences is not None:
+            # Distinct pairs are bounded by both the pair instances and the vocabulary
+            max_pairs = min(len(ids) * (window_size - 1), len(vocab) * (len(vocab) + 1) // 2)
+            table_size = 1 << (2 * max_pairs).bit_length()
+            rows, cols, counts = count_cooccurrences(ids, window_size, table_size)
+        else:
+            rows, cols, counts = _count_cooccurrences_vectorized(ids, window_size)
         
         # Build graph
+        keep = counts >= min_frequency
         self.graph.clear()
-        for (word1, word2), count in co_occurrence.items():
-            if count >= min_frequency:
-                if self.graph.has_edge(word1, word2):
-                    self.graph[word1][word2]['weight'] += count
-                else:
-                    self.graph.add_edge(word1, word2, weight=count)
+        self.graph.add_weighted_edges_from(
+            (vocab[row], vocab[col], count)
+            for row, col, count in zip(rows[keep].tolist(), cols[keep].tolist(), counts[keep].tolist())
+        )
+        self.invalidate()
     
     def build_sentence_graph(self, text: str, min_common_words: int = 2) -> None:
         """
@@ -72,31 +339,44 @@ class SemanticGraph:
             min_common_words: Minimum number of common words for an edge
         """
         self._parser.load_text(text)
-        sentences = self._parser.segment_sentences()
+        spans = list(self._parser.iter_sentence_spans())
+        
+        # Tokenize once and assign each word to the sentence containing it
+        starts = [start for start, _ in spans]
+        word_sets = [set() for _ in spans]
+        for word, start, _ in self._parser.tokenize_words_with_spans(lowercase=True):
+            word_sets[bisect_right(starts, start) - 1].add(word)
         
         # Create sentence nodes with word sets
         sentence_words = []
-        for i, sent in enumerate(sentences):
-            self._parser.load_text(sent)
-            words = set(self._parser.tokenize_words(lowercase=True))
+        for i, ((start, end), words) in enumerate(zip(spans, word_sets)):
+            sent = text[start:end]
             label = sent[:50] + ('...' if len(sent) > 50 else '')
             sentence_words.append((i, label, words))
         
         # Build graph
         self.graph.clear()
-        for i, label_i, words_i in sentence_words:
-            self.graph.add_node(i, label=label_i, word_count=len(words_i))
+        self.graph.add_nodes_from(
+            (i, {'label': label_i, 'word_count': len(words_i)})
+            for i, label_i, words_i in sentence_words
+        )
         
         # Add edges for similar sentences
-        for i, label_i, words_i in sentence_words:
-            for j, label_j, words_j in sentence_words[i+1:]:
-                common = words_i & words_j
-                if len(common) >= min_common_words:
-                    similarity = len(common) / max(len(words_i), len(words_j))
-                    self.graph.add_edge(i, j, weight=similarity, common_words=len(common))
-        
-        # Restore original text
-        self._parser.load_text(text)
+        edges = []
+        if min_common_words > 0 and import_optional("scipy.sparse") is not None:
+            word_sets = [words for _, _, words in sentence_words]
+            for i, j, common in _shared_word_counts(word_sets, min_common_words):
+                similarity = common / max(len(word_sets[i]), len(word_sets[j]))
+                edges.append((i, j, {'weight': similarity, 'common_words': common}))
+        else:
+            for i, label_i, words_i in sentence_words:
+                for j, label_j, words_j in sentence_words[i+1:]:
+                    common = words_i & words_j
+                    if len(common) >= min_common_words:
+                        similarity = len(common) / max(len(words_i), len(words_j))
+                        edges.append((i, j, {'weight': similarity, 'common_words': len(common)}))
+        self.graph.add_edges_from(edges)
+        self.invalidate()
     
     def add_concept_node(self, concept: str, **attributes) -> None:
         """
@@ -107,6 +387,7 @@ class SemanticGraph:
             **attributes: Additional node attributes
         """
         self.graph.add_node(concept, **attributes)
+        self.invalidate()
     
     def add_relationship(self, concept1: str, concept2: str, 
                         relationship_type: str = "related",
@@ -125,6 +406,7 @@ class SemanticGraph:
                           relationship=relationship_type,
                           weight=weight,
                           **attributes)
+        self.invalidate()
     
     def get_central_concepts(self, top_n: int = 10, 
                             centrality_type: str = "degree") -> List[Tuple[str, float]]:
@@ -141,36 +423,109 @@ class SemanticGraph:
         if len(self.graph) == 0:
             return []
         
+        if centrality_type not in ("degree", "betweenness", "closeness", "eigenvector"):
+            raise ValueError(f"Unknown centrality type: {centrality_type}")
+        
+        key = self._cache_key(centrality_type)
+        centrality = self._centrality_cache.get(key)
+        if centrality is None:
+            if len(self.graph) >= _IGRAPH_MIN_NODES and import_optional("igraph") is not None:
+                centrality = self._igraph_centrality(centrality_type)
+            else:
+                centrality = self._networkx_centrality(centrality_type)
+            self._centrality_cache[key] = centrality
+        
+        # Same result and tie order as sorted(..., reverse=True)[:top_n]
+        return heapq.nlargest(top_n, centrality.items(), key=lambda x: x[1])
+    
+    def _networkx_centrality(self, centrality_type: str) -> Dict:
+        """
+        Compute node centrality with NetworkX.
+        
+        Args:
+            centrality_type: Type of centrality ("degree", "betweenness", "closeness", "eigenvector")
+            
+        Returns:
+            Dictionary mapping nodes to centrality scores
+        """
         if centrality_type == "degree":
-            centrality = nx.degree_centrality(self.graph)
+            return nx.degree_centrality(self.graph)
         elif centrality_type == "betweenness":
-            centrality = nx.betweenness_centrality(self.graph)
+            return nx.betweenness_centrality(self.graph)
         elif centrality_type == "closeness":
-            centrality = nx.closeness_centrality(self.graph)
-        elif centrality_type == "eigenvector":
-            try:
-                centrality = nx.eigenvector_centrality(self.graph, max_iter=1000)
-            except nx.PowerIterationFailedConvergence:
-                # Fallback to degree centrality if eigenvector doesn't converge
-                centrality = nx.degree_centrality(self.graph)
+            return nx.closeness_centrality(self.graph)
+        try:
+            return nx.eigenvector_centrality(self.graph, max_iter=1000)
+        except nx.PowerIterationFailedConvergence:
+            # Fallback to degree centrality if eigenvector doesn't converge
+            return nx.degree_centrality(self.graph)
+    
+    def _igraph_centrality(self, centrality_type: str) -> Dict:
+        """
+        Compute node centrality with igraph, scaled like the NetworkX results.
+        
+        Args:
+            centrality_type: Type of centrality ("degree", "betweenness", "closeness", "eigenvector")
+            
+        Returns:
+            Dictionary mapping nodes to centrality scores
+        """
+        ig, nodes = self._to_igraph()
+        n = len(nodes)
+        
+        if centrality_type == "degree":
+            scores = np.asarray(ig.degree(), dtype=float) / (n - 1)
+        elif centrality_type == "betweenness":
+            # igraph counts unordered pairs; NetworkX normalizes by (n-1)(n-2)/2
+            scores = np.asarray(ig.betweenness(directed=False), dtype=float) * (2 / ((n - 1) * (n - 2)))
+        elif centrality_type == "closeness":
+            # igraph uses reachable nodes only; NetworkX also scales by the
+            # fraction of the graph that is reachable (Wasserman-Faust)
+            scores = np.nan_to_num(np.asarray(ig.closeness(normalized=True), dtype=float))
+            membership = np.asarray(ig.connected_components().membership)
+            reachable = np.bincount(membership)[membership] - 1
+            scores *= reachable / (n - 1)
         else:
-            raise ValueError(f"Unknown centrality type: {centrality_type}")
+            if not ig.is_connected():
+                # igraph's solver is not meaningful across components
+                return self._networkx_centrality(centrality_type)
+            # igraph counts an undirected self-loop twice in the adjacency
+            # matrix while NetworkX counts it once
+            weights = [0.5 if edge.is_loop() else 1.0 for edge in ig.es]
+            scores = np.asarray(ig.eigenvector_centrality(weights=weights), dtype=float)
+            norm = np.linalg.norm(scores)
+            if norm > 0:
+                scores /= norm
         
-        sorted_concepts = sorted(centrality.items(), key=lambda x: x[1], reverse=True)
-        return sorted_concepts[:top_n]
+        return dict(zip(nodes, scores.tolist()))
     
-    def find_communities(self) -> List[Set]:
+    def find_communities(self, resolution: float = 1.0) -> List[Set]:
         """
         Detect communities (clusters) in the graph.
         
+        Large graphs use igraph's Louvain implementation when available;
+        otherwise communities are found by greedy modularity maximization.
+        
+        Args:
+            resolution: Modularity resolution; values above 1 favour smaller
+                communities, values below 1 favour larger ones
+        
         Returns:
-            List of sets, each containing nodes in a community
+            List of sets, each containing nodes in a community, largest first
         """
         if len(self.graph) == 0:
             return []
         
+        if len(self.graph) >= _IGRAPH_MIN_NODES and import_optional("igraph") is not None:
+            ig, nodes = self._to_igraph()
+            clustering = ig.community_multilevel(resolution=resolution)
+            communities = [{nodes[i] for i in members} for members in clustering]
+            communities.sort(key=len, reverse=True)
+            return communities
+        
         # Use greedy modularity communities
-        communities = nx.community.greedy_modularity_communities(self.graph)
+        communities = nx.community.greedy_modularity_communities(
+            self.graph, resolution=resolution)
         return [set(c) for c in communities]
     
     def find_shortest_path(self, concept1: str, concept2: str) -> Optional[List[str]]:
@@ -184,10 +539,65 @@ class SemanticGraph:
         Returns:
             List of concepts forming the path, or None if no path exists
         """
-        try:
-            return nx.shortest_path(self.graph, concept1, concept2)
-        except (nx.NetworkXNoPath, nx.NodeNotFound):
+        if concept1 not in self.graph or concept2 not in self.graph:
             return None
+        return self._balanced_bidi_bfs(concept1, concept2)
+    
+    def _balanced_bidi_bfs(self, source, target) -> Optional[List]:
+        """
+        Find a shortest path with a bidirectional breadth-first search.
+        
+        Each step expands a full level of whichever frontier has the smaller
+        sum of degrees, so searches avoid fanning out from hub words first.
+        
+        Args:
+            source: Starting node (must be in the graph)
+            target: Ending node (must be in the graph)
+            
+        Returns:
+            List of nodes forming the path, or None if no path exists
+        """
+        if source == target:
+            return [source]
+        
+        adj = self.graph.adj
+        pred = {source: None}
+        succ = {target: None}
+        forward, backward = [source], [target]
+        
+        while forward and backward:
+            if sum(len(adj[v]) for v in forward) <= sum(len(adj[v]) for v in backward):
+                frontier, visited, other = forward, pred, succ
+            else:
+                frontier, visited, other = backward, succ, pred
+            
+            next_level = []
+            for u in frontier:
+                for w in adj[u]:
+                    if w in visited:
+                        continue
+                    visited[w] = u
+                    if w in other:
+                        # Frontiers met: join the two half-paths at w
+                        path = []
+                        node = w
+                        while node is not None:
+                            path.append(node)
+                            node = pred[node]
+                        path.reverse()
+                        node = succ[w]
+                        while node is not None:
+                            path.append(node)
+                            node = succ[node]
+                        return path
+                    next_level.append(w)
+            
+            if visited is pred:
+                forward = next_level
+            else:
+                backward = next_level
+        
+        return None
     
     def get_neighborhood(self, concept: str, radius: int = 1) -> Set[str]:
         """
@@ -203,22 +613,36 @@ class SemanticGraph:
         if concept not in self.graph:
             return set()
         
+        adj = self.graph.adj
         neighborhood = {concept}
-        current_level = {concept}
+        frontier = {concept}
         
         for _ in range(radius):
             next_level = set()
-            for node in current_level:
-                next_level.update(self.graph.neighbors(node))
-            neighborhood.update(next_level)
-            current_level = next_level
+            for node in frontier:
+                next_level.update(adj[node])
+            # Only expand nodes reached for the first time
+            frontier = next_level - neighborhood
+            if not frontier:
+                break
+            neighborhood |= frontier
         
         return neighborhood
     
-    def get_graph_statistics(self) -> Dict:
+    def get_graph_statistics(self, *, heavy: bool = False, approx: bool = True) -> Dict:
         """
         Get statistical measures of the graph.
         
+        Clustering and path-length measures cost at least one traversal per
+        node, so they are only computed when heavy is set.
+        
+        Args:
+            heavy: Whether to include avg_clustering and, for connected graphs,
+                diameter and avg_shortest_path
+            approx: Whether to estimate the heavy measures by sampling on
+                graphs with more than _STATS_SAMPLE_SIZE nodes; the estimated
+                diameter is a lower bound
+            
         Returns:
             Dictionary with graph statistics
         """
@@ -236,18 +660,54 @@ class SemanticGraph:
             'density': nx.density(self.graph),
             'connected_components': nx.number_connected_components(self.graph),
         }
+        if not heavy:
+            return stats
         
-        # Add average clustering coefficient if graph is not empty
-        if stats['nodes'] > 0:
+        connected = stats['connected_components'] == 1
+        if approx and stats['nodes'] > _STATS_SAMPLE_SIZE:
+            stats['avg_clustering'] = nx.approximation.average_clustering(
+                self.graph, trials=1000, seed=0)
+            if connected:
+                stats['diameter'], stats['avg_shortest_path'] = self._sampled_path_lengths()
+        elif stats['nodes'] >= _IGRAPH_MIN_NODES and import_optional("igraph") is not None:
+            ig, _ = self._to_igraph()
+            # NetworkX ignores self-loops when counting triangles
+            ig.simplify()
+            stats['avg_clustering'] = ig.transitivity_avglocal_undirected(mode="zero")
+            if connected:
+                stats['diameter'] = ig.diameter(directed=False)
+                stats['avg_shortest_path'] = ig.average_path_length(directed=False)
+        else:
             stats['avg_clustering'] = nx.average_clustering(self.graph)
-        
-        # Add diameter if graph is connected
-        if stats['connected_components'] == 1:
-            stats['diameter'] = nx.diameter(self.graph)
-            stats['avg_shortest_path'] = nx.average_shortest_path_length(self.graph)
+            if connected:
+                stats['diameter'] = nx.diameter(self.graph)
+                stats['avg_shortest_path'] = nx.average_shortest_path_length(self.graph)
         
         return stats
     
+    def _sampled_path_lengths(self) -> Tuple[int, float]:
+        """
+        Estimate diameter and average shortest path length of a connected graph.
+        
+        Runs a breadth-first search from _STATS_SAMPLE_SIZE random source nodes.
+        
+        Returns:
+            Tuple of (largest eccentricity among the sources, mean distance
+            from the sources to all other nodes)
+        """
+        nodes, _, indptr, indices = self._ensure_csr()
+        n = len(nodes)
+        sources = np.random.default_rng(0).choice(n, size=_STATS_SAMPLE_SIZE, replace=False)
+        
+        diameter = 0
+        total = 0
+        for source in sources.tolist():
+            distances = _bfs_distances(indptr, indices, source)
+            diameter = max(diameter, int(distances.max()))
+            total += int(distances.sum())
+        
+        return diameter, total / (len(sources) * (n - 1))
+    
     def export_graph_data(self) -> Dict:
         """
         Export graph data for visualization or storage.
@@ -279,3 +739,4 @@ class SemanticGraph:
     def clear(self) -> None:
         """Clear the graph."""
         self.graph.clear()
+        self.invalidate()
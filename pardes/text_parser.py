@@ -6,8 +6,103 @@ This represents the "P" (Peshat) level - literal, surface-level text processing.
 """
 
 import re
-from typing import List, Dict, Tuple
+from typing import Iterator, List, Dict, Optional, Tuple
 from collections import Counter
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from pardes._optional import jit
+
+
+# Sentence-ending punctuation followed by space and capital letter
+_SENT_SPLIT = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+# Words: sequences of letters and numbers, optionally joined by hyphens
+_WORD_RE = re.compile(r'\b[a-zA-Z0-9]+(?:-[a-zA-Z0-9]+)*\b')
+_PUNCT_RE = re.compile(r'[^a-zA-Z0-9\s]')
+_WS_RE = re.compile(r'\s+')
+
+# Texts with at least this many words use the numba n-gram kernel when
+# available; below it, loading numba costs more than the kernel saves
+_NUMBA_MIN_WORDS = 200_000
+
+
+def _count_ngrams(ids: np.ndarray, n: int, min_frequency: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Count every n-word window of a token-id array.
+    
+    Windows are hashed into an open-addressing table that stores the start of
+    the first window seen in each slot, so collisions are resolved by comparing
+    token ids and counts are exact.
+    
+    Args:
+        ids: Array of integer token ids
+        n: Number of words per window
+        min_frequency: Minimum count for a window to be returned
+        
+    Returns:
+        Tuple of (first start index, count) arrays for the windows that reach
+        min_frequency, ordered by first occurrence
+    """
+    num_windows = len(ids) - n + 1
+    size = 1
+    while size < 2 * num_windows:
+        size *= 2
+    mask = size - 1
+    slot_start = np.full(size, -1, dtype=np.int64)
+    slot_count = np.zeros(size, dtype=np.int64)
+    
+    for i in range(num_windows):
+        h = 0
+        for k in range(n):
+            h = (h * 1000003 ^ ids[i + k]) & mask
+        while True:
+            start = slot_start[h]
+            if start == -1:
+                slot_start[h] = i
+                slot_count[h] = 1
+                break
+            same = True
+            for k in range(n):
+                if ids[start + k] != ids[i + k]:
+                    same = False
+                    break
+            if same:
+                slot_count[h] += 1
+                break
+            h = (h + 1) & mask
+    
+    keep = (slot_start >= 0) & (slot_count >= min_frequency)
+    starts = slot_start[keep]
+    counts = slot_count[keep]
+    order = np.argsort(starts)
+    return starts[order], counts[order]
+
+
+def _count_ngrams_vectorized(ids: np.ndarray, n: int,
+                             min_frequency: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Count every n-word window of a token-id array using numpy only.
+    
+    Each window is viewed as one opaque n * 4 byte record so np.unique can
+    group identical windows in C.
+    
+    Args:
+        ids: Array of int32 token ids
+        n: Number of words per window
+        min_frequency: Minimum count for a window to be returned
+        
+    Returns:
+        Tuple of (first start index, count) arrays for the windows that reach
+        min_frequency, ordered by first occurrence
+    """
+    windows = np.ascontiguousarray(sliding_window_view(ids, n))
+    records = windows.view(np.dtype((np.void, windows.itemsize * n))).ravel()
+    _, first, counts = np.unique(records, return_index=True, return_counts=True)
+    
+    keep = counts >= min_frequency
+    starts = first[keep]
+    counts = counts[keep]
+    order = np.argsort(starts)
+    return starts[order], counts[order]
 
 
 class TextParser:
@@ -31,6 +126,7 @@ class TextParser:
         self.text = text
         self._sentences = None
         self._words = None
+        self._words_lower = None
         self._tokens = None
     
     def load_text(self, text: str) -> None:
@@ -43,6 +139,7 @@ class TextParser:
         self.text = text
         self._sentences = None
         self._words = None
+        self._words_lower = None
         self._tokens = None
     
     def segment_sentences(self) -> List[str]:
@@ -53,33 +150,133 @@ class TextParser:
             List of sentences
         """
         if self._sentences is None:
-            # Simple sentence segmentation using punctuation
-            # Handle common abbreviations
-            text = self.text
-            # Split on sentence-ending punctuation followed by space and capital letter
-            pattern = r'(?<=[.!?])\s+(?=[A-Z])'
-            sentences = re.split(pattern, text)
-            self._sentences = [s.strip() for s in sentences if s.strip()]
+            self._sentences = list(self.iter_sentences())
         return self._sentences
     
+    def iter_sentences(self) -> Iterator[str]:
+        """
+        Lazily yield the sentences of the text, one at a time.
+        
+        Returns:
+            Iterator over sentences, in the same order as segment_sentences()
+        """
+        if self._sentences is not None:
+            yield from self._sentences
+            return
+        
+        text = self.text
+        for start, end in self.iter_sentence_spans():
+            yield text[start:end]
+    
+    def iter_sentence_spans(self) -> Iterator[Tuple[int, int]]:
+        """
+        Lazily yield the character span of each sentence in the text.
+        
+        Returns:
+            Iterator over (start, end) offsets such that text[start:end] is the
+            corresponding sentence from iter_sentences()
+        """
+        # Simple sentence segmentation using punctuation
+        # Handle common abbreviations
+        text = self.text
+        start = 0
+        for match in _SENT_SPLIT.finditer(text):
+            span = self._strip_span(text, start, match.start())
+            if span is not None:
+                yield span
+            start = match.end()
+        span = self._strip_span(text, start, len(text))
+        if span is not None:
+            yield span
+    
+    @staticmethod
+    def _strip_span(text: str, start: int, end: int) -> Optional[Tuple[int, int]]:
+        """
+        Narrow a span of text to exclude leading and trailing whitespace.
+        
+        Args:
+            text: Full text
+            start: Start offset of the span
+            end: End offset of the span
+            
+        Returns:
+            Stripped (start, end) span, or None if the span is only whitespace
+        """
+        segment = text[start:end]
+        stripped = segment.lstrip()
+        if not stripped:
+            return None
+        start += len(segment) - len(stripped)
+        return start, start + len(stripped.rstrip())
+    
     def tokenize_words(self, lowercase: bool = False) -> List[str]:
         """
         Tokenize text into words, removing punctuation.
         
+        Args:
+            lowercase: Whether to convert words to lowercase
+            
+        Returns:
+            List of word tokens (a new list the caller may modify)
+        """
+        return list(self._word_list(lowercase))
+    
+    def _word_list(self, lowercase: bool = False) -> List[str]:
+        """
+        Get the cached token list, tokenizing on first use.
+        
+        The list is shared with the parser's cache and must not be modified.
+        
         Args:
             lowercase: Whether to convert words to lowercase
             
         Returns:
             List of word tokens
         """
-        # Extract words (sequences of letters, numbers, and hyphens)
-        pattern = r'\b[a-zA-Z0-9]+(?:-[a-zA-Z0-9]+)*\b'
-        tokens = re.findall(pattern, self.text)
+        if self._words is None:
+            # Extract words (sequences of letters, numbers, and hyphens)
+            self._words = _WORD_RE.findall(self.text)
         
         if lowercase:
-            tokens = [t.lower() for t in tokens]
+            if self._words_lower is None:
+                self._words_lower = [t.lower() for t in self._words]
+            return self._words_lower
+        
+        return self._words
+    
+    def iter_words(self, lowercase: bool = False) -> Iterator[str]:
+        """
+        Lazily yield word tokens without building the full token list.
+        
+        Args:
+            lowercase: Whether to convert words to lowercase
+            
+        Returns:
+            Iterator over words, in the same order as tokenize_words()
+        """
+        cached = self._words_lower if lowercase else self._words
+        if cached is not None:
+            return iter(cached)
+        if self._words is not None:
+            return map(str.lower, self._words)
+        
+        words = map(re.Match.group, _WORD_RE.finditer(self.text))
+        return map(str.lower, words) if lowercase else words
+    
+    def tokenize_words_with_spans(self, lowercase: bool = False) -> List[Tuple[str, int, int]]:
+        """
+        Tokenize text into words along with their character offsets.
         
-        return tokens
+        Args:
+            lowercase: Whether to convert words to lowercase
+            
+        Returns:
+            List of (word, start, end) tuples, in text order
+        """
+        if lowercase:
+            return [(m.group().lower(), m.start(), m.end())
+                    for m in _WORD_RE.finditer(self.text)]
+        return [(m.group(), m.start(), m.end()) for m in _WORD_RE.finditer(self.text)]
     
     def get_word_frequency(self, lowercase: bool = True, min_length: int = 1) -> Dict[str, int]:
         """
@@ -92,8 +289,9 @@ class TextParser:
         Returns:
             Dictionary mapping words to their frequencies
         """
-        words = self.tokenize_words(lowercase=lowercase)
-        words = [w for w in words if len(w) >= min_length]
+        words = self.iter_words(lowercase=lowercase)
+        if min_length > 1:
+            words = (w for w in words if len(w) >= min_length)
         return dict(Counter(words))
     
     def get_character_frequency(self, include_spaces: bool = False) -> Dict[str, int]:
@@ -106,8 +304,20 @@ class TextParser:
         Returns:
             Dictionary mapping characters to their frequencies
         """
-        text = self.text if include_spaces else self.text.replace(' ', '')
-        return dict(Counter(text))
+        text = self.text
+        if not text.isascii():
+            if not include_spaces:
+                text = text.replace(' ', '')
+            return dict(Counter(text))
+        
+        # ASCII text: count byte values in one vectorized pass
+        counts = np.bincount(np.frombuffer(text.encode('ascii'), dtype=np.uint8),
+                             minlength=128)
+        if not include_spaces:
+            counts[ord(' ')] = 0
+        # Keep first-occurrence order, as Counter would
+        chars = sorted((chr(c) for c in np.flatnonzero(counts)), key=text.find)
+        return {c: int(counts[ord(c)]) for c in chars}
     
     def get_statistics(self) -> Dict[str, int]:
         """
@@ -117,14 +327,14 @@ class TextParser:
             Dictionary with character count, word count, sentence count, etc.
         """
         sentences = self.segment_sentences()
-        words = self.tokenize_words()
+        words = self._word_list()
         
         return {
             'character_count': len(self.text),
             'word_count': len(words),
             'sentence_count': len(sentences),
-            'unique_words': len(set(w.lower() for w in words)),
-            'avg_word_length': sum(len(w) for w in words) / len(words) if words else 0,
+            'unique_words': len(set(self.iter_words(lowercase=True))),
+            'avg_word_length': sum(map(len, words)) / len(words) if words else 0,
             'avg_sentence_length': len(words) / len(sentences) if sentences else 0,
         }
     
@@ -141,7 +351,11 @@ class TextParser:
         Returns:
             List of (phrase, frequency) tuples, sorted by frequency
         """
-        words = self.tokenize_words(lowercase=True)
+        words = self._word_list(lowercase=True)
+        
+        if min_words >= 1:
+            return self._find_phrases_by_id(words, min_words, max_words, min_frequency)
+        
         phrases = []
         
         for n in range(min_words, max_words + 1):
@@ -155,6 +369,47 @@ class TextParser:
         
         return repeated
     
+    @staticmethod
+    def _find_phrases_by_id(words: List[str], min_words: int, max_words: int,
+                            min_frequency: int) -> List[Tuple[str, int]]:
+        """
+        Count repeated phrases over integer token ids.
+        
+        Uses the compiled n-gram kernel for texts of at least
+        _NUMBA_MIN_WORDS words when numba is installed and the numpy
+        implementation otherwise; only phrases that reach
+        min_frequency are turned back into strings.
+        
+        Args:
+            words: Lowercase word tokens
+            min_words: Minimum number of words in a phrase
+            max_words: Maximum number of words in a phrase
+            min_frequency: Minimum number of times a phrase must appear
+            
+        Returns:
+            List of (phrase, frequency) tuples, sorted by frequency
+        """
+        vocab = {}
+        ids = np.fromiter((vocab.setdefault(w, len(vocab)) for w in words),
+                          dtype=np.int32, count=len(words))
+        
+        count_ngrams = None
+        if len(words) >= _NUMBA_MIN_WORDS:
+            count_ngrams = jit(_count_ngrams)
+        if count_ngrams is None:
+            count_ngrams = _count_ngrams_vectorized
+        
+        repeated = []
+        for n in range(min_words, max_words + 1):
+            if len(words) < n:
+                break
+            starts, counts = count_ngrams(ids, n, min_frequency)
+            for start, count in zip(starts.tolist(), counts.tolist()):
+                repeated.append((' '.join(words[start:start+n]), count))
+        
+        repeated.sort(key=lambda x: x[1], reverse=True)
+        return repeated
+    
     def normalize_text(self, remove_punctuation: bool = True, 
                        lowercase: bool = True) -> str:
         """
@@ -171,9 +426,9 @@ class TextParser:
         
         if remove_punctuation:
             # Keep letters, numbers, and spaces
-            text = re.sub(r'[^a-zA-Z0-9\s]', ' ', text)
+            text = _PUNCT_RE.sub(' ', text)
             # Normalize whitespace
-            text = re.sub(r'\s+', ' ', text).strip()
+            text = _WS_RE.sub(' ', text).strip()
         
         if lowercase:
             text = text.lower()
@@ -21,6 +21,52 @@ class TestPatternDetector:
         detector.load_text("New text")
         assert detector.text == "New text"
     
+    def test_load_text_resets_search_cache(self):
+        """Test that case-insensitive searches see newly loaded text."""
+        detector = PatternDetector("The Cat sat.")
+        assert len(detector.get_keyword_contexts("cat")) == 1
+        
+        detector.load_text("The Dog sat.")
+        assert detector.get_keyword_contexts("cat") == []
+        assert len(detector.get_keyword_contexts("dog")) == 1
+    
+    def test_load_text_resets_sentence_tokens(self):
+        """Test that sentence-level detection sees newly loaded text."""
+        detector = PatternDetector("The cat sat down. The cat sat up.")
+        assert len(detector.find_parallel_structures()) == 1
+        
+        detector.load_text("The cat sat down. A dog ran off.")
+        assert detector.find_parallel_structures() == []
+    
+    def test_find_parallel_structures_separator(self):
+        """Test parallel structures over custom-separated segments."""
+        text = "the cat sat on the mat; the dog sat on the log; birds fly high"
+        detector = PatternDetector(text)
+        
+        parallels = detector.find_parallel_structures(separator=";")
+        assert len(parallels) == 1
+        assert parallels[0]['segment1'] == "the cat sat on the mat"
+        assert parallels[0]['similarity'] == 0.5
+    
+    def test_structure_results_are_cached(self):
+        """Test that repeated structure queries reuse cached results."""
+        detector = PatternDetector("the quick brown fox. the quick brown dog.")
+        first = detector.find_repeated_structures(min_occurrences=2)
+        expected = [dict(record) for record in first]
+        first[0]['occurrences'] = -1
+        first.clear()
+        
+        assert detector.find_repeated_structures(min_occurrences=2) == expected
+        
+        detector.load_text("Love is kind. Hope is bright. Hope is bright. Love is kind.")
+        chiastic = detector.find_chiastic_patterns()
+        expected = [dict(record, segments=list(record['segments'])) for record in chiastic]
+        chiastic[0]['segments'].clear()
+        assert detector.find_chiastic_patterns() == expected
+        
+        detector.load_text("no repeats here")
+        assert detector.find_repeated_structures(min_occurrences=2) == []
+    
     def test_find_literal_patterns(self):
         """Test literal pattern finding."""
         text = "The cat sat on the mat. The cat was fat."
@@ -38,6 +84,49 @@ class TestPatternDetector:
         matches = detector.find_literal_patterns("cat", case_sensitive=False)
         assert len(matches) == 3
     
+    def test_find_literal_patterns_batch(self, monkeypatch):
+        """Test that batched pattern finding matches single-pattern finding."""
+        import pardes.pattern_detector as pattern_detector
+        
+        text = "Cat and cat and CAT. The caat sat; aaa."
+        detector = PatternDetector(text)
+        patterns = ["cat", "aa", "ca+t", "[Tt]he", "dog"]
+        
+        for case_sensitive in (True, False):
+            results = detector.find_literal_patterns_batch(patterns, case_sensitive)
+            for pattern in patterns:
+                assert results[pattern] == detector.find_literal_patterns(pattern, case_sensitive)
+        
+        # Two regexes always reach the fallback; without hyperscan every
+        # pattern does, and the thread pool handles them all
+        expected = {p: detector.find_literal_patterns(p) for p in patterns}
+        assert detector.find_literal_patterns_batch(patterns, max_workers=4) == expected
+        monkeypatch.setattr(pattern_detector, "import_optional", lambda name: None)
+        assert detector.find_literal_patterns_batch(patterns, max_workers=4) == expected
+    
+    def test_find_literal_patterns_batch_nul(self):
+        """Test that literals containing NUL match in full."""
+        detector = PatternDetector("a\x00b a")
+        
+        results = detector.find_literal_patterns_batch(["a\x00b", "a"])
+        assert results["a\x00b"] == detector.find_literal_patterns("a\x00b")
+        assert [m["end"] for m in results["a\x00b"]] == [3]
+    
+    def test_find_literal_patterns_batch_threads(self):
+        """Test that batched searches can run from several threads at once."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        text = "the cat and the dog. " * 200
+        expected = PatternDetector(text).find_literal_patterns_batch(["cat", "dog"])
+        
+        def search(_):
+            detector = PatternDetector(text)
+            return [detector.find_literal_patterns_batch(["cat", "dog"]) for _ in range(20)]
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for results in executor.map(search, range(8)):
+                assert all(result == expected for result in results)
+    
     def test_find_repeated_structures(self):
         """Test repeated structure detection."""
         text = "the quick brown fox jumps over the lazy dog. the quick brown cat sleeps"
@@ -58,6 +147,23 @@ class TestPatternDetector:
         co_occurs = detector.find_co_occurrences("cat", "dog", window_size=50)
         assert len(co_occurs) >= 1
     
+    def test_find_co_occurrences_window(self):
+        """Test that co-occurrences outside the window are ignored."""
+        text = "cat " + "filler " * 20 + "dog"
+        detector = PatternDetector(text)
+        
+        assert detector.find_co_occurrences("cat", "dog", window_size=10) == []
+        assert len(detector.find_co_occurrences("cat", "dog", window_size=200)) == 1
+    
+    def test_find_co_occurrences_hyphenated(self):
+        """Test co-occurrences of a word that spans several tokens."""
+        text = "A well-known cat sat. The cat is well-known here."
+        detector = PatternDetector(text)
+        
+        co_occurs = detector.find_co_occurrences("Well-Known", "cat", window_size=10)
+        assert [c['position1'] for c in co_occurs] == [2, 33]
+        assert co_occurs[0]['context'] == "A well-known cat sat. "
+    
     def test_get_keyword_contexts(self):
         """Test keyword context extraction."""
         text = "The cat sat on the mat. The cat was very happy."
@@ -67,6 +173,15 @@ class TestPatternDetector:
         assert len(contexts) == 2
         assert all("cat" in ctx.lower() for ctx in contexts)
     
+    def test_iter_keyword_contexts(self):
+        """Test lazy keyword context and literal match iteration."""
+        text = "The cat sat on the mat. The cat was very happy."
+        detector = PatternDetector(text)
+        
+        contexts = detector.iter_keyword_contexts("cat", context_size=20)
+        assert next(contexts) == detector.get_keyword_contexts("cat", context_size=20)[0]
+        assert list(detector.iter_literal_patterns("cat")) == detector.find_literal_patterns("cat")
+    
     def test_analyze_pattern_density(self):
         """Test pattern density analysis."""
         text = "word " * 100  # Create text with repeated word
@@ -76,6 +191,14 @@ class TestPatternDetector:
         assert len(density) > 0
         assert all(d["matches"] > 0 for d in density)
     
+    def test_analyze_pattern_density_invalid_segment_size(self):
+        """Test that non-positive segment sizes are rejected."""
+        detector = PatternDetector("word " * 10)
+        
+        for segment_size in (0, -5):
+            with pytest.raises(ValueError, match="segment_size"):
+                detector.analyze_pattern_density("word", segment_size=segment_size)
+    
     def test_find_chiastic_patterns(self):
         """Test chiastic pattern detection."""
         # Simple ABBA structure
@@ -22,6 +22,49 @@ class TestSemanticGraph:
         assert graph.graph.number_of_nodes() > 0
         assert graph.graph.number_of_edges() > 0
     
+    def test_build_cooccurrence_graph_weights(self):
+        """Test that edge weights count shared sliding windows."""
+        graph = SemanticGraph()
+        graph.build_cooccurrence_graph("a b c d", window_size=3, min_frequency=1)
+        
+        weights = {tuple(sorted((u, v))): d["weight"] for u, v, d in graph.graph.edges(data=True)}
+        assert weights == {("a", "b"): 1, ("a", "c"): 1, ("b", "c"): 2, ("b", "d"): 1, ("c", "d"): 2}
+    
+    def test_build_cooccurrence_graph_without_numba(self, monkeypatch):
+        """Test that the numpy co-occurrence counter matches the compiled one."""
+        import pardes.semantic_graph as semantic_graph
+        
+        text = "the cat and the dog and the cat played with the dog again"
+        graph = SemanticGraph()
+        monkeypatch.setattr(semantic_graph, "_NUMBA_MIN_WORDS", 0)
+        graph.build_cooccurrence_graph(text, window_size=4, min_frequency=1)
+        expected = list(graph.graph.edges(data=True))
+        
+        monkeypatch.setattr(semantic_graph, "jit", lambda func: None)
+        graph.build_cooccurrence_graph(text, window_size=4, min_frequency=1)
+        assert list(graph.graph.edges(data=True)) == expected
+    
+    def test_build_cooccurrence_graph_keeps_no_token_cache(self):
+        """Test that building does not leave token lists cached on the parser."""
+        graph = SemanticGraph()
+        graph.build_cooccurrence_graph("The cat sat with the cat", min_frequency=1)
+        
+        assert graph.graph.number_of_nodes() == 4
+        assert graph._parser._words is None
+        assert graph._parser._words_lower is None
+    
+    def test_build_cooccurrence_graph_small_text_skips_numba(self, monkeypatch):
+        """Test that short texts never load the numba kernel."""
+        import pardes.semantic_graph as semantic_graph
+        
+        def fail(func):
+            raise AssertionError("numba kernel requested for a short text")
+        
+        monkeypatch.setattr(semantic_graph, "jit", fail)
+        graph = SemanticGraph()
+        graph.build_cooccurrence_graph("a b c a b c", window_size=3, min_frequency=1)
+        assert graph.graph["a"]["b"]["weight"] == 4
+    
     def test_build_sentence_graph(self):
         """Test sentence similarity graph building."""
         text = "The cat sat. The dog sat. The bird flew."
@@ -30,6 +73,35 @@ class TestSemanticGraph:
         
         assert graph.graph.number_of_nodes() == 3  # Three sentences
     
+    def test_build_sentence_graph_without_scipy(self, monkeypatch):
+        """Test that the pure-Python sentence graph matches the sparse one."""
+        import pardes.semantic_graph as semantic_graph
+        
+        text = "The cat sat on the mat. The dog sat on the rug. A bird flew away. The cat ran."
+        graph = SemanticGraph()
+        graph.build_sentence_graph(text, min_common_words=1)
+        expected = list(graph.graph.edges(data=True))
+        
+        monkeypatch.setattr(semantic_graph, "import_optional", lambda name: None)
+        graph.build_sentence_graph(text, min_common_words=1)
+        assert list(graph.graph.edges(data=True)) == expected
+    
+    def test_build_sentence_graph_in_blocks(self, monkeypatch):
+        """Test that splitting the sparse product into row blocks keeps the edges."""
+        pytest.importorskip("scipy")
+        import pardes.semantic_graph as semantic_graph
+        
+        text = ("The cat sat on the mat. The dog sat on the rug. A bird flew away. "
+                "The cat ran to the mat. A dog flew to the rug. The bird sat on the cat.")
+        graph = SemanticGraph()
+        graph.build_sentence_graph(text, min_common_words=2)
+        expected = list(graph.graph.edges(data=True))
+        assert expected
+        
+        monkeypatch.setattr(semantic_graph, "_SENTENCE_BLOCK_ROWS", 2)
+        graph.build_sentence_graph(text, min_common_words=2)
+        assert list(graph.graph.edges(data=True)) == expected
+    
     def test_add_concept_node(self):
         """Test adding concept nodes."""
         graph = SemanticGraph()
@@ -69,6 +141,58 @@ class TestSemanticGraph:
         assert len(central) > 0
         assert central[0][0] == "central"  # Most central node
     
+    def test_get_central_concepts_cache_invalidation(self):
+        """Test that cached centrality is refreshed after the graph changes."""
+        graph = SemanticGraph()
+        graph.add_relationship("a", "b")
+        graph.add_relationship("a", "c")
+        assert graph.get_central_concepts(top_n=1)[0][0] == "a"
+        
+        graph.add_relationship("d", "b")
+        graph.add_relationship("e", "b")
+        assert graph.get_central_concepts(top_n=1)[0][0] == "b"
+        
+        # Direct edits that keep node and edge counts need invalidate()
+        graph.graph.remove_edge("a", "c")
+        graph.graph.add_edge("e", "c")
+        graph.invalidate()
+        assert dict(graph.get_central_concepts(top_n=5))["a"] == 0.25
+    
+    def test_get_central_concepts_igraph(self):
+        """Test that igraph centralities match the NetworkX ones."""
+        pytest.importorskip("igraph")
+        import networkx as nx
+        
+        graph = SemanticGraph()
+        for u, v in nx.gnm_random_graph(60, 150, seed=1).edges():
+            graph.add_relationship(f"n{u}", f"n{v}")
+        graph.add_relationship("n0", "n0")
+        
+        for centrality_type in ("degree", "betweenness", "closeness", "eigenvector"):
+            expected = graph._networkx_centrality(centrality_type)
+            actual = graph._igraph_centrality(centrality_type)
+            assert actual.keys() == expected.keys()
+            assert all(abs(actual[k] - expected[k]) < 1e-4 for k in expected)
+    
+    def test_get_central_concepts_uses_igraph(self, monkeypatch):
+        """Test that large graphs are scored through igraph with NetworkX scaling."""
+        pytest.importorskip("igraph")
+        import networkx as nx
+        from pardes.semantic_graph import _IGRAPH_MIN_NODES
+        
+        graph = SemanticGraph()
+        for u, v in nx.gnm_random_graph(_IGRAPH_MIN_NODES, 1500, seed=4).edges():
+            graph.add_relationship(u, v)
+        
+        references = {"degree": nx.degree_centrality, "closeness": nx.closeness_centrality}
+        for centrality_type, reference in references.items():
+            expected = reference(graph.graph)
+            monkeypatch.setattr(graph, "_networkx_centrality", None)
+            top = graph.get_central_concepts(top_n=10, centrality_type=centrality_type)
+            assert len(top) == 10
+            assert all(abs(score - expected[node]) < 1e-9 for node, score in top)
+            assert top[0][1] == pytest.approx(max(expected.values()))
+    
     def test_find_communities(self):
         """Test community detection."""
         graph = SemanticGraph()
@@ -85,6 +209,27 @@ class TestSemanticGraph:
         communities = graph.find_communities()
         assert len(communities) >= 1
     
+    def test_find_communities_igraph(self):
+        """Test community detection on a graph large enough for igraph."""
+        pytest.importorskip("igraph")
+        
+        graph = SemanticGraph()
+        # 60 cliques of 10 nodes, joined in a ring by single edges
+        for c in range(60):
+            members = [f"c{c}_{i}" for i in range(10)]
+            for i, u in enumerate(members):
+                for v in members[i + 1:]:
+                    graph.add_relationship(u, v)
+            graph.add_relationship(members[0], f"c{(c + 1) % 60}_1")
+        
+        communities = graph.find_communities()
+        assert set().union(*communities) == set(graph.graph.nodes())
+        assert sum(len(c) for c in communities) == len(graph.graph)
+        assert len(communities) >= 30
+        
+        coarse = graph.find_communities(resolution=0.05)
+        assert len(coarse) < len(communities)
+    
     def test_find_shortest_path(self):
         """Test shortest path finding."""
         graph = SemanticGraph()
@@ -99,6 +244,23 @@ class TestSemanticGraph:
         path = graph.find_shortest_path("a", "c")
         assert path == ["a", "b", "c"]
     
+    def test_find_shortest_path_matches_networkx(self):
+        """Test that path lengths match NetworkX on a random graph."""
+        import networkx as nx
+        
+        reference = nx.gnm_random_graph(80, 120, seed=3)
+        graph = SemanticGraph()
+        for u, v in reference.edges():
+            graph.add_relationship(u, v)
+        
+        for target in range(1, 80):
+            path = graph.find_shortest_path(0, target)
+            if nx.has_path(reference, 0, target):
+                assert len(path) - 1 == nx.shortest_path_length(reference, 0, target)
+                assert all(reference.has_edge(u, v) for u, v in zip(path, path[1:]))
+            else:
+                assert path is None
+    
     def test_find_shortest_path_no_path(self):
         """Test shortest path when no path exists."""
         graph = SemanticGraph()
@@ -131,6 +293,21 @@ class TestSemanticGraph:
         neighborhood_2 = graph.get_neighborhood("center", radius=2)
         assert "far" in neighborhood_2
     
+    def test_get_neighborhood_after_direct_edit(self):
+        """Test that one-hop neighborhoods read the current adjacency."""
+        graph = SemanticGraph()
+        graph.add_relationship("a", "b")
+        graph.add_relationship("b", "c")
+        assert graph.get_neighborhood("a", radius=2) == {"a", "b", "c"}
+        
+        graph.graph.remove_edge("b", "c")
+        graph.graph.add_edge("a", "c")
+        assert graph.get_neighborhood("a") == {"a", "b", "c"}
+        assert graph.get_neighborhood("a", radius=0) == {"a"}
+        
+        graph.invalidate()
+        assert graph.get_neighborhood("c", radius=2) == {"a", "b", "c"}
+    
     def test_get_graph_statistics(self):
         """Test graph statistics calculation."""
         graph = SemanticGraph()
@@ -145,6 +322,31 @@ class TestSemanticGraph:
         assert "density" in stats
         assert "connected_components" in stats
     
+    def test_get_graph_statistics_heavy(self):
+        """Test that heavy statistics match NetworkX on small and large graphs."""
+        import networkx as nx
+        
+        graph = SemanticGraph()
+        assert "avg_clustering" not in graph.get_graph_statistics()
+        
+        for n in (30, 600):
+            graph.clear()
+            source = nx.powerlaw_cluster_graph(n, 3, 0.3, seed=2)
+            for u, v in source.edges():
+                graph.add_relationship(u, v)
+            graph.add_relationship(0, 0)
+            
+            stats = graph.get_graph_statistics(heavy=True, approx=False)
+            assert abs(stats["avg_clustering"] - nx.average_clustering(graph.graph)) < 1e-9
+            assert stats["diameter"] == nx.diameter(graph.graph)
+            assert abs(stats["avg_shortest_path"]
+                       - nx.average_shortest_path_length(graph.graph)) < 1e-9
+        
+        estimate = graph.get_graph_statistics(heavy=True)
+        assert 0 < estimate["diameter"] <= stats["diameter"]
+        assert abs(estimate["avg_shortest_path"] - stats["avg_shortest_path"]) < 0.5
+        assert abs(estimate["avg_clustering"] - stats["avg_clustering"]) < 0.1
+    
     def test_export_graph_data(self):
         """Test graph data export."""
         graph = SemanticGraph()
@@ -32,6 +32,52 @@ class TestTextParser:
         assert sentences[1] == "How are you?"
         assert sentences[2] == "I am fine!"
     
+    def test_iter_sentences(self):
+        """Test lazy sentence iteration."""
+        text = "Hello world. How are you? I am fine!"
+        parser = TextParser(text)
+        
+        assert list(parser.iter_sentences()) == parser.segment_sentences()
+        assert next(TextParser(text).iter_sentences()) == "Hello world."
+    
+    def test_iter_sentence_spans(self):
+        """Test that sentence spans slice out the segmented sentences."""
+        text = "  Hello world.   How are you?\n I am fine!  "
+        parser = TextParser(text)
+        
+        spans = list(parser.iter_sentence_spans())
+        assert [text[start:end] for start, end in spans] == parser.segment_sentences()
+    
+    def test_tokenize_words_with_spans(self):
+        """Test word tokenization with character offsets."""
+        text = "Hello, well-known World!"
+        parser = TextParser(text)
+        
+        tokens = parser.tokenize_words_with_spans(lowercase=True)
+        assert [word for word, _, _ in tokens] == parser.tokenize_words(lowercase=True)
+        assert tokens[1] == ("well-known", 7, 17)
+        assert all(text[start:end].lower() == word for word, start, end in tokens)
+    
+    def test_tokenize_words_returns_copy(self):
+        """Test that modifying returned tokens leaves the parser intact."""
+        parser = TextParser("a b")
+        parser.tokenize_words(lowercase=True).clear()
+        parser.tokenize_words().append("c")
+        
+        assert parser.get_word_frequency() == {"a": 1, "b": 1}
+        assert parser.tokenize_words() == ["a", "b"]
+    
+    def test_iter_words(self):
+        """Test lazy word iteration with and without cached tokens."""
+        text = "Hello, well-known World!"
+        
+        assert list(TextParser(text).iter_words()) == ["Hello", "well-known", "World"]
+        assert list(TextParser(text).iter_words(lowercase=True)) == ["hello", "well-known", "world"]
+        
+        parser = TextParser(text)
+        parser.tokenize_words()
+        assert list(parser.iter_words(lowercase=True)) == parser.tokenize_words(lowercase=True)
+    
     def test_tokenize_words(self):
         """Test word tokenization."""
         text = "Hello, world! How are you?"
@@ -76,6 +122,18 @@ class TestTextParser:
         assert freq["b"] == 2
         assert freq["c"] == 2
     
+    def test_character_frequency_matches_counter(self):
+        """Test that ASCII and non-ASCII texts are counted like Counter."""
+        from collections import Counter
+        
+        for text in ("the cat,  sat\n on the mat!", "caf\u00e9 au lait", ""):
+            parser = TextParser(text)
+            with_spaces = parser.get_character_frequency(include_spaces=True)
+            without_spaces = parser.get_character_frequency()
+            
+            assert list(with_spaces.items()) == list(Counter(text).items())
+            assert list(without_spaces.items()) == list(Counter(text.replace(" ", "")).items())
+    
     def test_statistics(self):
         """Test text statistics."""
         text = "Hello world. This is a test."
@@ -99,6 +157,28 @@ class TestTextParser:
         phrase_texts = [p[0] for p in phrases]
         assert "the quick brown" in phrase_texts
     
+    def test_find_phrases_without_numba(self, monkeypatch):
+        """Test that the numpy phrase counter matches the compiled one."""
+        import pardes.text_parser as text_parser
+        
+        text = "a b c a b c a b d. The a b c again, a b."
+        monkeypatch.setattr(text_parser, "_NUMBA_MIN_WORDS", 0)
+        expected = TextParser(text).find_phrases(min_words=1, max_words=4, min_frequency=2)
+        
+        monkeypatch.setattr(text_parser, "jit", lambda func: None)
+        assert TextParser(text).find_phrases(min_words=1, max_words=4, min_frequency=2) == expected
+    
+    def test_find_phrases_small_text_skips_numba(self, monkeypatch):
+        """Test that short texts never load the numba kernel."""
+        import pardes.text_parser as text_parser
+        
+        def fail(func):
+            raise AssertionError("numba kernel requested for a short text")
+        
+        monkeypatch.setattr(text_parser, "jit", fail)
+        phrases = TextParser("a b c a b c").find_phrases(min_frequency=2)
+        assert ("a b c", 2) in phrases
+    
     def test_normalize_text(self):
         """Test text normalization."""
         text = "Hello, World! How are you?"